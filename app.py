@@ -1,6 +1,8 @@
 # app.py
 # The main Flask web server application with SocketIO for real-time communication.
 
+import json
+import os
 import uuid
 from flask import Flask, render_template, request
 from flask_socketio import SocketIO, emit, join_room, leave_room
@@ -8,24 +10,214 @@ from flask_socketio import SocketIO, emit, join_room, leave_room
 # Import the game engine from Part 1
 from game import Game
 
+# Redis is optional: only needed when running multiple workers. The in-memory
+# store below is used whenever REDIS_URL is not configured.
+try:
+    import redis
+except ImportError:
+    redis = None
+
 # --- Server Setup ---
 app = Flask(__name__)
 # In a production environment, use a more secure and permanent secret key
 app.config['SECRET_KEY'] = 'a-very-secret-and-temporary-key-for-dev'
+# With REDIS_URL set, room broadcasts fan out through Redis pub/sub so they
+# reach sockets held by other workers; unset, emits stay in-process. Room
+# broadcasts must go through socketio.emit (not the handler-context emit)
+# for this to apply.
+REDIS_URL = os.environ.get('REDIS_URL')
 # Allow any origin for easy development; tighten this in production
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*", message_queue=REDIS_URL)
 
 # --- Server State Management ---
-# These dictionaries will store the state of all games and players on the server.
-# games: {game_id: Game_Object}
-games: dict = {}
-# player_game_map: {player_sid: game_id}
-player_game_map: dict = {}
-# lobbies: {game_id: [list of player details]}
-lobbies: dict = {}
-# A simple way to manage the next available lobby
-waiting_lobby_id = str(uuid.uuid4())
-lobbies[waiting_lobby_id] = []
+# Games, lobby membership, and the sid->game mapping live in a store so they
+# can be shared between workers. With REDIS_URL set (e.g.
+# redis://localhost:6379/0) they go to Redis and survive a restart; otherwise
+# they are plain dicts and the server behaves exactly as the original
+# single-process version.
+
+class InMemoryStore:
+    """Single-process store backed by plain dicts."""
+
+    def __init__(self):
+        # games: {game_id: Game_Object}
+        self._games: dict = {}
+        # lobbies: {game_id: [list of player details]}
+        self._lobbies: dict = {}
+        # player_game_map: {player_sid: game_id}
+        self._player_game_map: dict = {}
+        self._waiting_lobby_id = str(uuid.uuid4())
+        self._lobbies[self._waiting_lobby_id] = []
+
+    def get_game(self, game_id):
+        return self._games.get(game_id)
+
+    def set_game(self, game_id, game):
+        self._games[game_id] = game
+
+    def get_waiting_lobby_id(self) -> str:
+        return self._waiting_lobby_id
+
+    def get_lobby(self, game_id):
+        return self._lobbies.get(game_id)
+
+    def update_lobby(self, game_id, mutate):
+        """Applies mutate(lobby) to the lobby and stores the result.
+
+        Returns the updated lobby, or None if the lobby no longer exists.
+        Plain dict ops are enough here: a single process runs one handler
+        at a time between eventlet yields.
+        """
+        lobby = self._lobbies.get(game_id)
+        if lobby is None:
+            return None
+        lobby = mutate(lobby)
+        self._lobbies[game_id] = lobby
+        return lobby
+
+    def claim_lobby_for_start(self, game_id, can_start):
+        """If can_start(lobby) holds, retires the lobby, opens a fresh
+        waiting lobby, and returns the claimed player list; otherwise None.
+        At most one caller can claim a given lobby.
+        """
+        lobby = self._lobbies.get(game_id)
+        if lobby is None or not can_start(lobby):
+            return None
+        del self._lobbies[game_id]
+        self._waiting_lobby_id = str(uuid.uuid4())
+        self._lobbies[self._waiting_lobby_id] = []
+        return lobby
+
+    def get_player_game(self, player_sid):
+        return self._player_game_map.get(player_sid)
+
+    def set_player_game(self, player_sid, game_id):
+        self._player_game_map[player_sid] = game_id
+
+    def remove_player_game(self, player_sid):
+        self._player_game_map.pop(player_sid, None)
+
+class RedisStore:
+    """Shared store for multi-worker deployments.
+
+    Games are stored as to_snapshot() JSON under game:{id}, lobbies are JSON
+    blobs under lobby:{id}, the sid->game mapping is a hash, and the
+    waiting-lobby pointer is a plain key. Any worker can load a game, apply
+    an action, and save it back, so sockets don't have to land on the worker
+    that created the game.
+    """
+
+    def __init__(self, client):
+        self._redis = client
+        # Ensure a waiting lobby exists without clobbering another worker's.
+        if self._redis.setnx('waiting_lobby_id', str(uuid.uuid4())):
+            self._redis.set(f"lobby:{self.get_waiting_lobby_id()}", json.dumps([]))
+
+    def get_game(self, game_id):
+        raw = self._redis.get(f'game:{game_id}')
+        return Game.from_snapshot(json.loads(raw)) if raw is not None else None
+
+    def set_game(self, game_id, game):
+        self._redis.set(f'game:{game_id}', json.dumps(game.to_snapshot()))
+
+    def get_waiting_lobby_id(self) -> str:
+        return self._redis.get('waiting_lobby_id').decode()
+
+    def get_lobby(self, game_id):
+        raw = self._redis.get(f'lobby:{game_id}')
+        return json.loads(raw) if raw is not None else None
+
+    def update_lobby(self, game_id, mutate):
+        """Applies mutate(lobby) to the lobby blob under WATCH/MULTI.
+
+        Returns the updated lobby, or None if the lobby no longer exists.
+        If another worker writes the blob between read and write, the
+        transaction aborts and the read-modify-write retries, so concurrent
+        joins/toggles on different workers can't overwrite each other.
+        """
+        key = f'lobby:{game_id}'
+        with self._redis.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(key)
+                    raw = pipe.get(key)
+                    if raw is None:
+                        pipe.unwatch()
+                        return None
+                    lobby = mutate(json.loads(raw))
+                    pipe.multi()
+                    pipe.set(key, json.dumps(lobby))
+                    pipe.execute()
+                    return lobby
+                except redis.WatchError:
+                    continue
+
+    def claim_lobby_for_start(self, game_id, can_start):
+        """If can_start(lobby) holds, atomically retires the lobby, rotates
+        the waiting-lobby pointer, and returns the claimed player list;
+        otherwise None.
+
+        The delete/rotate runs in the same WATCH/MULTI transaction as the
+        check, so when two workers see an all-ready lobby only one claim
+        commits — the loser retries, finds the lobby gone, and returns None
+        instead of starting a second game.
+        """
+        key = f'lobby:{game_id}'
+        new_id = str(uuid.uuid4())
+        with self._redis.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(key)
+                    raw = pipe.get(key)
+                    lobby = json.loads(raw) if raw is not None else None
+                    if lobby is None or not can_start(lobby):
+                        pipe.unwatch()
+                        return None
+                    pipe.multi()
+                    pipe.delete(key)
+                    pipe.set('waiting_lobby_id', new_id)
+                    pipe.set(f'lobby:{new_id}', json.dumps([]))
+                    pipe.execute()
+                    return lobby
+                except redis.WatchError:
+                    continue
+
+    def get_player_game(self, player_sid):
+        game_id = self._redis.hget('sid_to_game', player_sid)
+        return game_id.decode() if game_id is not None else None
+
+    def set_player_game(self, player_sid, game_id):
+        self._redis.hset('sid_to_game', player_sid, game_id)
+
+    def remove_player_game(self, player_sid):
+        self._redis.hdel('sid_to_game', player_sid)
+
+if REDIS_URL and redis is not None:
+    store = RedisStore(redis.from_url(REDIS_URL))
+else:
+    store = InMemoryStore()
+
+# --- Lobby Broadcast Debouncing ---
+# Rapid ready-toggles used to emit one lobby_update per click. Broadcasts are
+# coalesced instead: the first change in a window schedules a single delayed
+# emit, which reads the (by then current) lobby state from the store.
+LOBBY_UPDATE_DELAY = 0.05  # seconds
+_pending_lobby_updates: set = set()
+
+def schedule_lobby_update(game_id):
+    """Emits at most one lobby_update per lobby per delay window."""
+    if game_id in _pending_lobby_updates:
+        return
+    _pending_lobby_updates.add(game_id)
+
+    def _broadcast():
+        socketio.sleep(LOBBY_UPDATE_DELAY)
+        _pending_lobby_updates.discard(game_id)
+        lobby = store.get_lobby(game_id)
+        if lobby is not None:
+            socketio.emit('lobby_update', lobby, room=game_id)
+
+    socketio.start_background_task(_broadcast)
 
 # --- Flask HTTP Route ---
 @app.route('/')
@@ -45,65 +237,67 @@ def handle_join_lobby(data):
     """A player sends their name to join the waiting lobby."""
     player_name = data.get('name', 'Anonymous')
     player_sid = request.sid
-    
-    # Use the global waiting lobby ID
-    game_id = waiting_lobby_id
-    
-    # Create player object for the lobby
-    player_info = {
-        'id': player_sid,
-        'name': player_name,
-        'color': f'hsl({len(lobbies[game_id]) * 90}, 70%, 50%)', # Assign a distinct color
-        'is_ready': False
-    }
-
-    # Add player to lobby and map their session to the game
-    lobbies[game_id].append(player_info)
-    player_game_map[player_sid] = game_id
+
+    def add_player(lobby):
+        lobby.append({
+            'id': player_sid,
+            'name': player_name,
+            'color': f'hsl({len(lobby) * 90}, 70%, 50%)', # Assign a distinct color
+            'is_ready': False
+        })
+        return lobby
+
+    # Join the current waiting lobby. If it rotated out underneath us (a
+    # game just started from it), fetch the fresh one and try again.
+    while True:
+        game_id = store.get_waiting_lobby_id()
+        if store.update_lobby(game_id, add_player) is not None:
+            break
+
+    # Map the player's session to the game
+    store.set_player_game(player_sid, game_id)
     join_room(game_id)
-    
+
     print(f"Player {player_name} ({player_sid}) joined lobby {game_id}")
-    
+
     # Broadcast the updated lobby list to all players in that lobby
-    emit('lobby_update', lobbies[game_id], room=game_id)
+    schedule_lobby_update(game_id)
 
 @socketio.on('player_ready')
 def handle_player_ready():
     """A player clicks the 'Ready' button."""
     player_sid = request.sid
-    game_id = player_game_map.get(player_sid)
-    
-    if not game_id or game_id not in lobbies:
+    game_id = store.get_player_game(player_sid)
+    if not game_id:
+        return # Player not in a valid lobby
+
+    def toggle_ready(lobby):
+        for player in lobby:
+            if player['id'] == player_sid:
+                player['is_ready'] = not player['is_ready'] # Toggle ready state
+                break
+        return lobby
+
+    if store.update_lobby(game_id, toggle_ready) is None:
         return # Player not in a valid lobby
 
-    # Mark the player as ready
-    for player in lobbies[game_id]:
-        if player['id'] == player_sid:
-            player['is_ready'] = not player['is_ready'] # Toggle ready state
-            break
-            
     # Broadcast the change
-    emit('lobby_update', lobbies[game_id], room=game_id)
+    schedule_lobby_update(game_id)
 
-    # Check if we can start the game
-    # Conditions: 2-4 players, and all of them are ready.
-    lobby = lobbies[game_id]
-    players_ready = all(p['is_ready'] for p in lobby)
-    player_count = len(lobby)
+    # Start conditions: 2-4 players, and all of them are ready.
+    def can_start(lobby):
+        return 2 <= len(lobby) <= 4 and all(p['is_ready'] for p in lobby)
+
+    # The claim is atomic, so even if several workers see an all-ready lobby
+    # at once, exactly one gets the player list back and starts the game.
+    lobby = store.claim_lobby_for_start(game_id, can_start)
+    if lobby is not None:
+        print(f"Starting game {game_id} with {len(lobby)} players.")
 
-    if 2 <= player_count <= 4 and players_ready:
-        print(f"Starting game {game_id} with {player_count} players.")
-        
         # Create the game instance using the engine from game.py
         game = Game(player_details=lobby)
-        games[game_id] = game
-        
-        # Move lobby from waiting to active and create a new waiting lobby
-        del lobbies[game_id]
-        global waiting_lobby_id
-        waiting_lobby_id = str(uuid.uuid4())
-        lobbies[waiting_lobby_id] = []
-        
+        store.set_game(game_id, game)
+
         # Send the initial game state to all players in the room
         socketio.emit('game_start', game.get_game_state(), room=game_id)
 
@@ -111,49 +305,56 @@ def handle_player_ready():
 def handle_player_action(action_data):
     """Handles an action sent by a player during the game."""
     player_sid = request.sid
-    game_id = player_game_map.get(player_sid)
+    game_id = store.get_player_game(player_sid)
 
-    if not game_id or game_id not in games:
+    game = store.get_game(game_id) if game_id else None
+    if game is None:
         return
 
-    game = games[game_id]
-
     # Prevent actions if it's not the player's turn, unless it's an 'end_turn' action
     if game.get_current_player().id != player_sid:
         emit('action_error', {'message': "Not your turn."})
         return
 
-    success = game.handle_player_action(player_sid, action_data)
+    error = game.handle_player_action(player_sid, action_data)
 
     # If the action was valid, check for win. If not won, advance turn.
-    if success:
+    if error is None:
         if not game.game_over:
             game.next_turn()
 
-        # Broadcast the new state to all players
-        socketio.emit('game_update', game.get_game_state(), room=game_id)
+        # Save before broadcasting, so whichever worker handles the next
+        # action loads a game with this one already applied.
+        delta = game.get_state_delta()
+        store.set_game(game_id, game)
+
+        # Broadcast only what changed; clients merge it into the full state
+        # they received with game_start. The hex list never travels again.
+        socketio.emit('game_update_delta', delta, room=game_id)
     else:
-        # If the action was invalid, just send an update to the acting player
-        emit('action_error', {'message': game.message})
+        # Invalid actions don't change any state, so nothing is serialized or
+        # broadcast; the acting player just gets the rejection reason.
+        emit('action_error', {'message': error})
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """A player has disconnected."""
     player_sid = request.sid
-    game_id = player_game_map.get(player_sid)
+    game_id = store.get_player_game(player_sid)
     print(f"Client disconnected: {player_sid}")
-    
+
     # Clean up state
     if game_id:
         leave_room(game_id)
-        if game_id in player_game_map:
-            del player_game_map[player_sid]
-        
+        store.remove_player_game(player_sid)
+
         # Handle disconnection from a lobby
-        if game_id in lobbies:
-            lobbies[game_id] = [p for p in lobbies[game_id] if p['id'] != player_sid]
+        def drop_player(lobby):
+            return [p for p in lobby if p['id'] != player_sid]
+
+        if store.update_lobby(game_id, drop_player) is not None:
             # If lobby is now empty, could remove it, but for simplicity we'll leave it
-            emit('lobby_update', lobbies[game_id], room=game_id)
+            schedule_lobby_update(game_id)
         
         # TODO: Handle disconnection from an active game (e.g., mark player as disconnected,
         # allow for reconnection, or end the game if all players leave).
@@ -2,7 +2,6 @@
 # Contains the core logic for the Nexus Miners game, independent of the server or UI.
 
 import random
-from collections import deque
 from typing import Dict, List, Tuple, Optional, Set, Any
 
 # --- Constants for Game Balance ---
@@ -21,11 +20,25 @@ COST_SABOTAGE_CONDUIT = 3
 # The third coordinate 's' is constrained by q + r + s = 0.
 HexCoord = Tuple[int, int]  # (q, r)
 
-# Represents an edge between two hexes. Stored as a sorted tuple to be canonical.
+# Represents an edge between two hexes at the API boundary. Stored as a
+# sorted tuple to be canonical.
 Edge = Tuple[HexCoord, HexCoord]
 
+# Internally edges are packed into a single int (see Board.edge_key) so the
+# conduit maps hash one small int instead of a tuple of tuples.
+EdgeKey = int
+
+def _edge(a: HexCoord, b: HexCoord) -> Edge:
+    """Canonicalizes two hex coordinates into an edge. A plain compare beats
+    sorted() here, which would allocate a list per call on the action path."""
+    return (a, b) if a <= b else (b, a)
+
 class Hex:
     """Represents a single hexagonal tile on the game board."""
+    # ~61 hexes per game and potentially many concurrent games; slots drop
+    # the per-instance __dict__ and speed up attribute access.
+    __slots__ = ('q', 'r', 's', 'resource', 'is_base_for')
+
     def __init__(self, q: int, r: int, resource: Optional[str] = None, is_base_for: Optional[str] = None):
         self.q = q
         self.r = r
@@ -42,32 +55,116 @@ class Hex:
 
 class Player:
     """Represents a player in the game."""
+    __slots__ = ('id', 'name', 'color', 'action_points', 'base_hex',
+                 '_controlled_cache', '_controlled_cache_version')
+
     def __init__(self, player_id: str, name: str, color: str):
         self.id = player_id
         self.name = name
         self.color = color
         self.action_points = 0
         self.base_hex: Optional[HexCoord] = None
+        # Cached result of _count_controlled_resources, tagged with the
+        # board's conduits_version it was computed against.
+        self._controlled_cache: Optional[int] = None
+        self._controlled_cache_version = -1
 
     def __repr__(self):
         return f"Player({self.name}, AP:{self.action_points})"
 
 class Board:
     """Manages the game board, including hexes, resources, and conduits."""
-    def __init__(self, players: List[Player]):
+    def __init__(self, players: List[Player], rng: Optional[random.Random] = None):
+        self._rng = rng if rng is not None else random.Random()
         self.radius = GRID_RADIUS
         self.hexes: Dict[HexCoord, Hex] = {}
-        self.conduits: Dict[Edge, Dict[str, Any]] = {}  # {edge: {"player_id": str, "reinforced": bool}}
+        # Conduits partitioned by owner, so per-player work never has to
+        # filter a global dict: {player_id: {edge key: {"reinforced": bool}}}.
+        self.conduits_by_player: Dict[str, Dict[EdgeKey, Dict[str, Any]]] = {p.id: {} for p in players}
+        # Flat index answering "who owns this edge?" in one lookup.
+        self.conduits_index: Dict[EdgeKey, str] = {}
+        # Incrementally maintained per-player network views, so connectivity
+        # queries never have to rescan the full conduit dict. Keyed by the
+        # dense hex indices from coord_to_idx so the BFS hot path hashes
+        # small ints rather than coordinate tuples.
+        # player_adj: {player_id: {hex index: set of indices joined to it by that player's conduits}}
+        self.player_adj: Dict[str, Dict[int, Set[int]]] = {p.id: {} for p in players}
+        # Bumped whenever the conduit set changes, so per-player caches can
+        # tell when a recompute is actually needed.
+        self.conduits_version = 0
+        # Every resource hex (excluding the Nexus), filled in by
+        # _place_special_hexes: coordinates plus a bitmask over the dense
+        # hex indices for intersecting against BFS visited masks.
+        self.resource_hexes: Set[HexCoord] = set()
+        self.resources_mask = 0
         self._generate_grid()
         self._place_special_hexes(players)
 
+    def edge_key(self, h1: HexCoord, h2: HexCoord) -> Optional[EdgeKey]:
+        """Packs two hex coordinates into a canonical single-int edge key.
+
+        Returns None if either coordinate is off the board, mirroring a
+        failed dict lookup for bad client input.
+        """
+        i1 = self.coord_to_idx.get(h1)
+        i2 = self.coord_to_idx.get(h2)
+        if i1 is None or i2 is None:
+            return None
+        return (i1 << 16) | i2 if i1 < i2 else (i2 << 16) | i1
+
+    def edge_from_key(self, key: EdgeKey) -> Edge:
+        """Unpacks an edge key back into its canonical coordinate form."""
+        return _edge(self.idx_to_coord[key >> 16], self.idx_to_coord[key & 0xFFFF])
+
+    def add_conduit(self, key: EdgeKey, player_id: str):
+        """Records a new conduit and updates the owner's adjacency view."""
+        self.conduits_by_player[player_id][key] = {"reinforced": False}
+        self.conduits_index[key] = player_id
+        i1, i2 = key >> 16, key & 0xFFFF
+        adj = self.player_adj[player_id]
+        adj.setdefault(i1, set()).add(i2)
+        adj.setdefault(i2, set()).add(i1)
+        self.conduits_version += 1
+
+    def remove_conduit(self, key: EdgeKey):
+        """Removes a conduit and updates the owner's adjacency view."""
+        owner_id = self.conduits_index.pop(key)
+        del self.conduits_by_player[owner_id][key]
+        i1, i2 = key >> 16, key & 0xFFFF
+        adj = self.player_adj[owner_id]
+        adj[i1].discard(i2)
+        if not adj[i1]:
+            del adj[i1]
+        adj[i2].discard(i1)
+        if not adj[i2]:
+            del adj[i2]
+        self.conduits_version += 1
+
     def _generate_grid(self):
         """Creates a hexagonal grid of the specified radius."""
+        # The r bounds follow from |q| <= R, |r| <= R, |q + r| <= R, so this
+        # visits exactly the valid hexes with no filtering.
         for q in range(-self.radius, self.radius + 1):
-            for r in range(-self.radius, self.radius + 1):
-                if -q - r in range(-self.radius, self.radius + 1):
-                    self.hexes[(q, r)] = Hex(q, r)
-    
+            for r in range(max(-self.radius, -q - self.radius), min(self.radius, -q + self.radius) + 1):
+                self.hexes[(q, r)] = Hex(q, r)
+        self._build_neighbor_table()
+
+    def _build_neighbor_table(self):
+        """Builds the static per-hex lookups, since the grid never changes."""
+        # Dense integer index for each hex (0..V-1). Graph traversal works on
+        # these ints; coordinates only appear at the API boundary.
+        self.idx_to_coord: List[HexCoord] = list(self.hexes)
+        self.coord_to_idx: Dict[HexCoord, int] = {c: i for i, c in enumerate(self.idx_to_coord)}
+        self.nexus_idx = self.coord_to_idx[(0, 0)]
+        directions = [(1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1), (1, -1)]
+        self.neighbors: Dict[HexCoord, Tuple[HexCoord, ...]] = {
+            (q, r): tuple(
+                (q + dq, r + dr) for dq, dr in directions if (q + dq, r + dr) in self.hexes
+            )
+            for q, r in self.hexes
+        }
+
+
     def _place_special_hexes(self, players: List[Player]):
         """Places the Nexus, player bases, and resources on the grid."""
         edge_hexes = [h for h in self.hexes.values() if max(abs(h.q), abs(h.r), abs(h.s)) == self.radius]
@@ -85,7 +182,7 @@ class Board:
 
         # Place resources on internal hexes
         potential_resource_spots = [h for h in internal_hexes if h.resource is None]
-        random.shuffle(potential_resource_spots)
+        self._rng.shuffle(potential_resource_spots)
         
         resource_types = ["IRON", "CARBON", "POWER"]
         num_resource_nodes = min(len(potential_resource_spots), max(9, len(players) * 3))
@@ -93,36 +190,62 @@ class Board:
         for i in range(num_resource_nodes):
             hex_to_place = potential_resource_spots[i]
             hex_to_place.resource = resource_types[i % len(resource_types)]
+            self.resource_hexes.add(hex_to_place.coordinates)
+            self.resources_mask |= 1 << self.coord_to_idx[hex_to_place.coordinates]
 
-    def get_neighbors(self, hex_coord: HexCoord) -> List[HexCoord]:
-        """Returns a list of valid neighbor coordinates for a given hex."""
-        q, r = hex_coord
-        # Directions in axial coordinates
-        directions = [(1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1), (1, -1)]
-        neighbors = []
-        for dq, dr in directions:
-            neighbor_coord = (q + dq, r + dr)
-            if neighbor_coord in self.hexes:
-                neighbors.append(neighbor_coord)
-        return neighbors
+    def get_neighbors(self, hex_coord: HexCoord) -> Tuple[HexCoord, ...]:
+        """Returns the valid neighbor coordinates for a given hex."""
+        # .get() so an off-board coordinate (e.g. from a bad client) yields no
+        # neighbors rather than a KeyError.
+        return self.neighbors.get(hex_coord, ())
 
 class Game:
     """The main class that orchestrates the entire game."""
-    def __init__(self, player_details: List[Dict[str, str]]):
+    def __init__(self, player_details: List[Dict[str, str]], rng_seed: Optional[int] = None):
         """
         Initializes the game.
         player_details: A list of dicts, e.g., [{"id": "xyz", "name": "Alpha", "color": "#ff0000"}]
+        rng_seed: Optional seed; games with the same seed and players get the
+            same board and turn order, which makes setups reproducible.
         """
+        self.rng_seed = rng_seed if rng_seed is not None else random.randrange(2**32)
+        # Every random decision goes through this private generator, so a
+        # game never depends on (or disturbs) the global random state.
+        self._rng = random.Random(self.rng_seed)
         self.players = [Player(p['id'], p['name'], p['color']) for p in player_details]
-        self.board = Board(self.players)
+        self.board = Board(self.players, self._rng)
         self.turn_number = 0
         self.current_player_idx = 0
         self.game_over = False
         self.winner: Optional[Player] = None
         self.message = "Game has started!"
-        random.shuffle(self.players) # Randomize turn order
+        self._rng.shuffle(self.players) # Randomize turn order
+        self._init_serialization_caches()
         self.start_turn()
 
+    def _init_serialization_caches(self):
+        """Builds the static part of the serialized state and the delta buffers.
+
+        The hex list never changes after board creation, so it is serialized
+        exactly once. Conduit changes are accumulated so the server can send
+        deltas instead of re-broadcasting the full board.
+        """
+        self._static_board = {
+            "radius": self.board.radius,
+            "hexes": [
+                {
+                    "q": h.q,
+                    "r": h.r,
+                    "resource": h.resource,
+                    "is_base_for": h.is_base_for,
+                } for h in self.board.hexes.values()
+            ],
+        }
+        # Conduits placed/reinforced (upserts) and removed since the last
+        # get_state_delta() call.
+        self._conduits_changed: List[Dict[str, Any]] = []
+        self._conduits_removed: List[Edge] = []
+
     def get_current_player(self) -> Player:
         return self.players[self.current_player_idx]
 
@@ -132,8 +255,7 @@ class Game:
         player = self.get_current_player()
         
         # Calculate AP
-        controlled_resources = self._get_controlled_resources(player)
-        bonus_ap = len(controlled_resources) * RESOURCE_BONUS_AP
+        bonus_ap = self._count_controlled_resources(player) * RESOURCE_BONUS_AP
         player.action_points = BASE_AP_PER_TURN + bonus_ap
         
         self.message = f"{player.name}'s turn. AP: {player.action_points}"
@@ -146,175 +268,197 @@ class Game:
         self.current_player_idx = (self.current_player_idx + 1) % len(self.players)
         self.start_turn()
 
-    def handle_player_action(self, player_id: str, action: Dict[str, Any]) -> bool:
+    def handle_player_action(self, player_id: str, action: Dict[str, Any]) -> Optional[str]:
         """
         Main entry point for a player performing an action.
-        Returns True if the action was successful, False otherwise.
+        Returns None if the action was successful, or an error message
+        describing why it was rejected. Rejections never touch the shared
+        game state (board, AP, self.message), so nothing needs to be
+        re-serialized or broadcast for them.
         """
         player = self.get_current_player()
         if player.id != player_id or self.game_over:
-            self.message = "Not your turn or game is over."
-            return False
+            return "Not your turn or game is over."
 
-        action_type = action.get('type')
-        action_handlers = {
-            'place_conduit': self._handle_place_conduit,
-            'reinforce_conduit': self._handle_reinforce_conduit,
-            'sabotage_conduit': self._handle_sabotage_conduit,
-        }
-
-        handler = action_handlers.get(action_type)
+        handler = self._ACTION_HANDLERS.get(action.get('type'))
         if not handler:
-            self.message = "Invalid action type."
-            return False
-
-        success = handler(player, action)
-        if success:
-            if self._check_win_condition(player):
+            return "Invalid action type."
+
+        error = handler(self, player, action)
+        if error is None:
+            # Only the acting player's network can have changed, so one BFS
+            # serves both the win check and the controlled-resource count
+            # that start_turn and the broadcast will read next. Other
+            # players' counts recompute lazily if a sabotage touched them.
+            reached = self._get_reachable(player)
+            player._controlled_cache = (reached & self.board.resources_mask).bit_count()
+            player._controlled_cache_version = self.board.conduits_version
+            if self._check_win_condition(player, reached):
                 self.game_over = True
                 self.winner = player
                 self.message = f"Game Over! {player.name} has connected to the Nexus and wins!"
-        
-        return success
 
-    def _handle_place_conduit(self, player: Player, action: Dict) -> bool:
+        return error
+
+    def _handle_place_conduit(self, player: Player, action: Dict) -> Optional[str]:
         if player.action_points < COST_PLACE_CONDUIT:
-            self.message = "Not enough AP to place a conduit."
-            return False
-        
+            return "Not enough AP to place a conduit."
+
         hex1_coord = tuple(action['hex1'])
         hex2_coord = tuple(action['hex2'])
-        edge = tuple(sorted((hex1_coord, hex2_coord)))
+        key = self.board.edge_key(hex1_coord, hex2_coord)
 
         # Validation
-        if edge in self.board.conduits:
-            self.message = "A conduit already exists there."
-            return False
-        if hex2_coord not in self.board.get_neighbors(hex1_coord):
-            self.message = "Hexes are not adjacent."
-            return False
-        
-        # Check if placement is adjacent to player's network
-        is_adjacent_to_network = False
-        if player.base_hex in edge:
-            is_adjacent_to_network = True
-        else:
-            for existing_edge in self.board.conduits:
-                if self.board.conduits[existing_edge]['player_id'] == player.id:
-                    if hex1_coord in existing_edge or hex2_coord in existing_edge:
-                        is_adjacent_to_network = True
-                        break
-        
+        if key is not None and key in self.board.conduits_index:
+            return "A conduit already exists there."
+        if key is None or hex2_coord not in self.board.get_neighbors(hex1_coord):
+            return "Hexes are not adjacent."
+
+        # Check if placement is adjacent to player's network. The adjacency
+        # dict's keys are exactly the hexes touched by the player's conduits,
+        # so this is three membership tests instead of a scan over all conduits.
+        adj = self.board.player_adj[player.id]
+        is_adjacent_to_network = (
+            player.base_hex in (hex1_coord, hex2_coord)
+            or key >> 16 in adj
+            or key & 0xFFFF in adj
+        )
+
         if not is_adjacent_to_network:
-            self.message = "Must place conduits adjacent to your existing network."
-            return False
+            return "Must place conduits adjacent to your existing network."
 
         # Execute action
         player.action_points -= COST_PLACE_CONDUIT
-        self.board.conduits[edge] = {"player_id": player.id, "reinforced": False}
+        self.board.add_conduit(key, player.id)
+        self._conduits_changed.append(self._serialize_conduit(key))
         self.message = f"{player.name} placed a conduit."
-        return True
+        return None
 
-    def _handle_reinforce_conduit(self, player: Player, action: Dict) -> bool:
+    def _handle_reinforce_conduit(self, player: Player, action: Dict) -> Optional[str]:
         if player.action_points < COST_REINFORCE_CONDUIT:
-            self.message = "Not enough AP to reinforce."
-            return False
+            return "Not enough AP to reinforce."
 
-        edge = tuple(sorted((tuple(action['hex1']), tuple(action['hex2']))))
-        conduit = self.board.conduits.get(edge)
+        key = self.board.edge_key(tuple(action['hex1']), tuple(action['hex2']))
+        conduit = self.board.conduits_by_player[player.id].get(key)
 
-        if not conduit or conduit['player_id'] != player.id:
-            self.message = "You can only reinforce your own conduits."
-            return False
+        if not conduit:
+            return "You can only reinforce your own conduits."
         if conduit['reinforced']:
-            self.message = "Conduit is already reinforced."
-            return False
-            
+            return "Conduit is already reinforced."
+
         player.action_points -= COST_REINFORCE_CONDUIT
         conduit['reinforced'] = True
+        self._conduits_changed.append(self._serialize_conduit(key))
         self.message = f"{player.name} reinforced a conduit."
-        return True
+        return None
 
-    def _handle_sabotage_conduit(self, player: Player, action: Dict) -> bool:
+    def _handle_sabotage_conduit(self, player: Player, action: Dict) -> Optional[str]:
         if player.action_points < COST_SABOTAGE_CONDUIT:
-            self.message = "Not enough AP to sabotage."
-            return False
+            return "Not enough AP to sabotage."
 
-        edge = tuple(sorted((tuple(action['hex1']), tuple(action['hex2']))))
-        conduit = self.board.conduits.get(edge)
+        key = self.board.edge_key(tuple(action['hex1']), tuple(action['hex2']))
+        owner_id = self.board.conduits_index.get(key)
+
+        if owner_id is None or owner_id == player.id:
+            return "Cannot sabotage your own or non-existent conduits."
+        if self.board.conduits_by_player[owner_id][key]['reinforced']:
+            return "Cannot sabotage a reinforced conduit."
 
-        if not conduit or conduit['player_id'] == player.id:
-            self.message = "Cannot sabotage your own or non-existent conduits."
-            return False
-        if conduit['reinforced']:
-            self.message = "Cannot sabotage a reinforced conduit."
-            return False
-            
         player.action_points -= COST_SABOTAGE_CONDUIT
-        del self.board.conduits[edge]
+        self.board.remove_conduit(key)
+        self._conduits_removed.append(self.board.edge_from_key(key))
         self.message = f"{player.name} sabotaged an opponent's conduit."
-        return True
+        return None
+
+    # Built once at class creation; handle_player_action used to rebuild this
+    # dict on every action. The values are plain functions, called with self.
+    _ACTION_HANDLERS = {
+        'place_conduit': _handle_place_conduit,
+        'reinforce_conduit': _handle_reinforce_conduit,
+        'sabotage_conduit': _handle_sabotage_conduit,
+    }
 
     def _get_player_network(self, player: Player) -> Set[HexCoord]:
         """Gets all hexes connected by a player's conduits."""
-        player_conduits = {edge for edge, data in self.board.conduits.items() if data['player_id'] == player.id}
-        network_hexes = set()
-        if player_conduits:
-            # Add all hexes that are part of the player's conduits
-            for h1, h2 in player_conduits:
-                network_hexes.add(h1)
-                network_hexes.add(h2)
-        return network_hexes
+        idx_to_coord = self.board.idx_to_coord
+        return {idx_to_coord[i] for i in self.board.player_adj[player.id]}
 
     def _is_connected(self, player: Player, start_node: HexCoord, end_node: HexCoord) -> bool:
         """Checks if two nodes are connected in the player's network using BFS."""
-        player_conduits = {edge for edge, data in self.board.conduits.items() if data['player_id'] == player.id}
-        if not player_conduits:
-            return False
+        end = self.board.coord_to_idx[end_node]
+        return bool(self._reach_from(player, start_node) >> end & 1)
 
-        q = deque([start_node])
-        visited = {start_node}
-        
-        while q:
-            current_hex = q.popleft()
-            if current_hex == end_node:
-                return True
-            
-            # Find neighbors connected by player's conduits
-            for neighbor in self.board.get_neighbors(current_hex):
-                edge = tuple(sorted((current_hex, neighbor)))
-                if edge in player_conduits and neighbor not in visited:
-                    visited.add(neighbor)
-                    q.append(neighbor)
-        return False
+    def _reach_from(self, player: Player, start_node: HexCoord) -> int:
+        """BFS over the player's conduit network, returning a bitmask over
+        the dense hex indices of everything reachable from start_node.
+
+        With at most 61 hexes the visited set fits in one int, so each visit
+        is a shift and an or instead of set hashing, and the frontier is a
+        plain list walked by index rather than a deque.
+        """
+        adj = self.board.player_adj[player.id]
+        start = self.board.coord_to_idx[start_node]
+        if start not in adj:
+            return 0
+
+        visited = 1 << start
+        frontier = [start]
+        i = 0
+        while i < len(frontier):
+            for neighbor in adj[frontier[i]]:
+                bit = 1 << neighbor
+                if not visited & bit:
+                    visited |= bit
+                    frontier.append(neighbor)
+            i += 1
+        return visited
         
-    def _get_controlled_resources(self, player: Player) -> Set[HexCoord]:
-        """Finds all resource nodes connected to a player's base."""
-        controlled = set()
-        resource_hexes = [h for h in self.board.hexes.values() if h.resource and h.resource != "NEXUS"]
-        for res_hex in resource_hexes:
-            if self._is_connected(player, player.base_hex, res_hex.coordinates):
-                controlled.add(res_hex.coordinates)
+    def _get_reachable(self, player: Player) -> int:
+        """Returns the reachability bitmask from the player's base."""
+        return self._reach_from(player, player.base_hex)
+
+    def _count_controlled_resources(self, player: Player) -> int:
+        """Counts the resource nodes connected to a player's base.
+
+        The result is cached on the player and only recomputed when the
+        board's conduit set has changed since it was last calculated.
+        """
+        if player._controlled_cache_version == self.board.conduits_version:
+            return player._controlled_cache
+
+        controlled = (self._get_reachable(player) & self.board.resources_mask).bit_count()
+
+        player._controlled_cache = controlled
+        player._controlled_cache_version = self.board.conduits_version
         return controlled
 
-    def _check_win_condition(self, player: Player) -> bool:
-        """Checks if the player has met the win conditions."""
-        nexus_hex_coord = (0, 0)
-        
+    def _check_win_condition(self, player: Player, reached: Optional[int] = None) -> bool:
+        """Checks if the player has met the win conditions.
+
+        Accepts an already-computed reachability mask so callers that just
+        ran the BFS don't trigger another one.
+        """
+        if reached is None:
+            reached = self._get_reachable(player)
+
         # 1. Check for Nexus connection
-        connected_to_nexus = self._is_connected(player, player.base_hex, nexus_hex_coord)
-        if not connected_to_nexus:
+        if not reached >> self.board.nexus_idx & 1:
             return False
 
         # 2. Check for resource control
-        num_controlled_resources = len(self._get_controlled_resources(player))
-        if num_controlled_resources < WIN_CONDITION_RESOURCES:
+        if (reached & self.board.resources_mask).bit_count() < WIN_CONDITION_RESOURCES:
             return False
 
         return True
 
-    def get_game_state(self) -> Dict[str, Any]:
-        """Serializes the entire game state into a dictionary for the frontend."""
+    def to_snapshot(self) -> Dict[str, Any]:
+        """Serializes the game into a self-contained, JSON-safe dict.
+
+        Unlike get_game_state (which is shaped for the frontend), a snapshot
+        holds everything needed to rebuild the live object graph: no object
+        references, edges flattened to plain ints, and the RNG state captured
+        so a restored game continues identically.
+        """
         return {
             "players": [
                 {
@@ -322,32 +466,134 @@ class Game:
                     "name": p.name,
                     "color": p.color,
                     "action_points": p.action_points,
-                    "base_hex": p.base_hex,
-                    "controlled_resources": len(self._get_controlled_resources(p)),
+                    "base_hex": list(p.base_hex),
                 } for p in self.players
             ],
             "board": {
                 "radius": self.board.radius,
-                "hexes": [
-                    {
-                        "q": h.q,
-                        "r": h.r,
-                        "resource": h.resource,
-                        "is_base_for": h.is_base_for,
-                    } for h in self.board.hexes.values()
-                ],
-                "conduits": [
-                    {
-                        "hex1": edge[0],
-                        "hex2": edge[1],
-                        "player_id": data["player_id"],
-                        "reinforced": data["reinforced"],
-                    } for edge, data in self.board.conduits.items()
-                ]
+                "hexes": [[h.q, h.r, h.resource, h.is_base_for] for h in self.board.hexes.values()],
             },
+            "conduits": [
+                [e[0][0], e[0][1], e[1][0], e[1][1], player_id, data["reinforced"]]
+                for player_id, edges in self.board.conduits_by_player.items()
+                for e, data in (
+                    (self.board.edge_from_key(key), d) for key, d in edges.items()
+                )
+            ],
+            "turn_number": self.turn_number,
+            "current_player_idx": self.current_player_idx,
+            "game_over": self.game_over,
+            "winner_id": self.winner.id if self.winner else None,
+            "message": self.message,
+            "rng_seed": self.rng_seed,
+            "rng_state": self._rng.getstate(),
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> "Game":
+        """Rebuilds a Game from a to_snapshot() dict (including one that made
+        a round trip through JSON)."""
+        game = cls.__new__(cls)
+        game.rng_seed = snapshot["rng_seed"]
+        game._rng = random.Random()
+        # JSON turns the RNG state's tuples into lists; setstate wants tuples.
+        version, internal_state, gauss_next = snapshot["rng_state"]
+        game._rng.setstate((version, tuple(internal_state), gauss_next))
+        game.players = []
+        for pd in snapshot["players"]:
+            player = Player(pd["id"], pd["name"], pd["color"])
+            player.action_points = pd["action_points"]
+            player.base_hex = tuple(pd["base_hex"])
+            game.players.append(player)
+
+        # Rebuild the board directly from the recorded hexes rather than
+        # re-running generation, which would re-randomize resources.
+        board = Board.__new__(Board)
+        board._rng = game._rng
+        board.radius = snapshot["board"]["radius"]
+        board.hexes = {}
+        board.conduits_by_player = {p.id: {} for p in game.players}
+        board.conduits_index = {}
+        board.player_adj = {p.id: {} for p in game.players}
+        board.conduits_version = 0
+        board.resource_hexes = set()
+        for q, r, resource, is_base_for in snapshot["board"]["hexes"]:
+            board.hexes[(q, r)] = Hex(q, r, resource=resource, is_base_for=is_base_for)
+            if resource and resource != "NEXUS":
+                board.resource_hexes.add((q, r))
+        board._build_neighbor_table()
+        board.resources_mask = 0
+        for c in board.resource_hexes:
+            board.resources_mask |= 1 << board.coord_to_idx[c]
+        for q1, r1, q2, r2, player_id, reinforced in snapshot["conduits"]:
+            key = board.edge_key((q1, r1), (q2, r2))
+            board.add_conduit(key, player_id)
+            board.conduits_by_player[player_id][key]["reinforced"] = reinforced
+        game.board = board
+
+        game.turn_number = snapshot["turn_number"]
+        game.current_player_idx = snapshot["current_player_idx"]
+        game.game_over = snapshot["game_over"]
+        game.winner = next((p for p in game.players if p.id == snapshot["winner_id"]), None)
+        game.message = snapshot["message"]
+        game._init_serialization_caches()
+        return game
+
+    def _serialize_conduit(self, key: EdgeKey) -> Dict[str, Any]:
+        """Serializes a single conduit for the frontend."""
+        owner_id = self.board.conduits_index[key]
+        data = self.board.conduits_by_player[owner_id][key]
+        edge = self.board.edge_from_key(key)
+        return {
+            "hex1": edge[0],
+            "hex2": edge[1],
+            "player_id": owner_id,
+            "reinforced": data["reinforced"],
+        }
+
+    def get_game_state(self) -> Dict[str, Any]:
+        """Serializes the entire game state into a dictionary for the frontend."""
+        board_state = dict(self._static_board)
+        board_state["conduits"] = [self._serialize_conduit(key) for key in self.board.conduits_index]
+        return {
+            "players": [
+                {
+                    "id": p.id,
+                    "name": p.name,
+                    "color": p.color,
+                    "action_points": p.action_points,
+                    "base_hex": p.base_hex,
+                    "controlled_resources": self._count_controlled_resources(p),
+                } for p in self.players
+            ],
+            "board": board_state,
+            "turn_number": self.turn_number,
+            "current_player_id": self.get_current_player().id,
+            "game_over": self.game_over,
+            "winner": self.winner.name if self.winner else None,
+            "message": self.message,
+        }
+
+    def get_state_delta(self) -> Dict[str, Any]:
+        """Returns only what changed since the last call, for incremental
+        broadcasts. Clients that already hold the full state (from game_start)
+        can merge this instead of receiving the board again."""
+        delta = {
+            "players": [
+                {
+                    "id": p.id,
+                    "action_points": p.action_points,
+                    "controlled_resources": self._count_controlled_resources(p),
+                } for p in self.players
+            ],
+            "conduits_changed": self._conduits_changed,
+            "conduits_removed": self._conduits_removed,
             "turn_number": self.turn_number,
             "current_player_id": self.get_current_player().id,
             "game_over": self.game_over,
             "winner": self.winner.name if self.winner else None,
             "message": self.message,
-        }
\ No newline at end of file
+        }
+        self._conduits_changed = []
+        self._conduits_removed = []
+        return delta
\ No newline at end of file
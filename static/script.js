@@ -42,10 +42,18 @@ document.addEventListener('DOMContentLoaded', () => {
     });
     
     socket.on('game_update', (newGameState) => {
+        // Full-state fallback (e.g. after a reconnect).
         console.log('Received game update:', newGameState);
         updateUI(newGameState);
     });
 
+    socket.on('game_update_delta', (delta) => {
+        console.log('Received game delta:', delta);
+        if (!gameState) return; // No base state to merge into yet
+        applyDelta(gameState, delta);
+        updateUI(gameState);
+    });
+
     socket.on('action_error', (data) => {
         // Simple feedback for invalid actions
         gameMessage.textContent = data.message;
@@ -55,6 +63,42 @@ document.addEventListener('DOMContentLoaded', () => {
     });
 
     // --- UI Update Functions ---
+    function sameEdge(a, b) {
+        // Both sides send edges in canonical (sorted) order.
+        return a.hex1[0] === b.hex1[0] && a.hex1[1] === b.hex1[1] &&
+               a.hex2[0] === b.hex2[0] && a.hex2[1] === b.hex2[1];
+    }
+
+    function applyDelta(state, delta) {
+        delta.players.forEach(dp => {
+            const player = state.players.find(p => p.id === dp.id);
+            if (player) {
+                player.action_points = dp.action_points;
+                player.controlled_resources = dp.controlled_resources;
+            }
+        });
+
+        delta.conduits_changed.forEach(c => {
+            const idx = state.board.conduits.findIndex(existing => sameEdge(existing, c));
+            if (idx >= 0) {
+                state.board.conduits[idx] = c; // e.g. reinforced
+            } else {
+                state.board.conduits.push(c);
+            }
+        });
+
+        delta.conduits_removed.forEach(edge => {
+            const removed = { hex1: edge[0], hex2: edge[1] };
+            state.board.conduits = state.board.conduits.filter(c => !sameEdge(c, removed));
+        });
+
+        state.turn_number = delta.turn_number;
+        state.current_player_id = delta.current_player_id;
+        state.game_over = delta.game_over;
+        state.winner = delta.winner;
+        state.message = delta.message;
+    }
+
     function updateLobby(players) {
         playerList.innerHTML = '';
         players.forEach(p => {